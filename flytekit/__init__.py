@@ -100,20 +100,17 @@ Scheduling
 
 """
 
+import functools
+import importlib
 import os
 import sys
+import typing
 from typing import Generator
 
-from rich import traceback
-
+# lazy_module has to be importable from flytekit before the rest of the package is loaded.
 from flytekit.lazy_import.lazy_module import lazy_module
 
-if sys.version_info < (3, 10):
-    from importlib_metadata import entry_points
-else:
-    from importlib.metadata import entry_points
-
-
+# isort: split
 from flytekit._version import __version__
 from flytekit.configuration import Config
 from flytekit.core.array_node_map_task import map_task
@@ -151,17 +148,48 @@ from flytekit.models.core.types import BlobType
 from flytekit.models.documentation import Description, Documentation, SourceCode
 from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
 from flytekit.models.types import LiteralType
-from flytekit.remote import FlyteRemote
-from flytekit.sensor.sensor_engine import SensorEngine
 from flytekit.types import directory, file, iterator
 from flytekit.types.directory import FlyteDirectory
 from flytekit.types.file import FlyteFile
-from flytekit.types.structured.structured_dataset import (
-    StructuredDataset,
-    StructuredDatasetFormat,
-    StructuredDatasetTransformerEngine,
-    StructuredDatasetType,
-)
+
+if typing.TYPE_CHECKING:
+    from flytekit.remote import FlyteRemote
+    from flytekit.sensor.sensor_engine import SensorEngine
+    from flytekit.types.structured.structured_dataset import (
+        StructuredDataset,
+        StructuredDatasetFormat,
+        StructuredDatasetTransformerEngine,
+        StructuredDatasetType,
+    )
+
+# Symbols that are expensive to import and are not needed to author tasks and workflows. They are resolved on first
+# attribute access through the module level ``__getattr__`` below (PEP 562).
+_LAZY_IMPORTS = {
+    "FlyteRemote": ("flytekit.remote", "FlyteRemote"),
+    "SensorEngine": ("flytekit.sensor.sensor_engine", "SensorEngine"),
+    "StructuredDataset": ("flytekit.types.structured.structured_dataset", "StructuredDataset"),
+    "StructuredDatasetFormat": ("flytekit.types.structured.structured_dataset", "StructuredDatasetFormat"),
+    "StructuredDatasetTransformerEngine": (
+        "flytekit.types.structured.structured_dataset",
+        "StructuredDatasetTransformerEngine",
+    ),
+    "StructuredDatasetType": ("flytekit.types.structured.structured_dataset", "StructuredDatasetType"),
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    spec = _LAZY_IMPORTS.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = spec
+    value = getattr(importlib.import_module(module_name), attr)
+    # Cache the resolved symbol so that subsequent lookups do not go through __getattr__ again.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 
 def current_context() -> ExecutionParameters:
@@ -184,6 +212,23 @@ def new_context() -> Generator[FlyteContext, None, None]:
     return FlyteContextManager.with_context(FlyteContextManager.current_context().new_builder())
 
 
+# Set this environment variable to "1" to skip loading the plugins registered under the ``flytekit.plugins`` entrypoint.
+DISABLE_PLUGIN_AUTOLOAD_ENV_VAR = "FLYTEKIT_DISABLE_PLUGIN_AUTOLOAD"
+
+_PLUGINS_LOADED = False
+
+
+@functools.lru_cache(maxsize=None)
+def _discovered_flytekit_plugins() -> tuple:
+    # importlib.metadata is comparatively expensive to import, so only pay for it when plugins are actually loaded.
+    if sys.version_info < (3, 10):
+        from importlib_metadata import entry_points
+    else:
+        from importlib.metadata import entry_points
+
+    return tuple(entry_points(group="flytekit.plugins"))
+
+
 def load_implicit_plugins():
     """
     This method allows loading all plugins that have the entrypoint specification. This uses the plugin loading
@@ -219,15 +264,60 @@ def load_implicit_plugins():
     TypeEngine.register(PanderaTransformer())
     # etc
     ```
+
+    Plugins are only discovered and loaded once per process. Set ``FLYTEKIT_DISABLE_PLUGIN_AUTOLOAD=1`` to skip this
+    step entirely.
     """
-    discovered_plugins = entry_points(group="flytekit.plugins")
-    for p in discovered_plugins:
+    global _PLUGINS_LOADED
+    if _PLUGINS_LOADED or os.environ.get(DISABLE_PLUGIN_AUTOLOAD_ENV_VAR) == "1":
+        return
+    _PLUGINS_LOADED = True
+
+    for p in _discovered_flytekit_plugins():
         p.load()
 
 
+# Set this environment variable to "1" to skip the work "import flytekit" does that is only needed to run tasks and
+# workflows: loading implicit plugins and installing rich tracebacks.
+FAST_IMPORT_ENV_VAR = "FLYTEKIT_FAST_IMPORT"
+
+_PYFLYTE_FAST_PATH_ARGS = frozenset({"--help"})
+
+
+def _is_fast_import() -> bool:
+    if os.environ.get(FAST_IMPORT_ENV_VAR) == "1":
+        return True
+    # pyflyte cannot set the environment variable itself because flytekit is imported before any pyflyte code runs.
+    argv = getattr(sys, "argv", None) or []
+    return len(argv) == 2 and os.path.basename(argv[0]) == "pyflyte" and argv[1] in _PYFLYTE_FAST_PATH_ARGS
+
+
+_FAST_IMPORT = _is_fast_import()
+
 # Load all implicit plugins
-load_implicit_plugins()
+if not _FAST_IMPORT:
+    load_implicit_plugins()
+
+
+def _install_rich_traceback():
+    from rich import traceback
 
-# Pretty-print exception messages
-if os.environ.get(LOGGING_RICH_FMT_ENV_VAR) != "0":
     traceback.install(width=None, extra_lines=0)
+
+
+def _lazy_rich_excepthook(exc_type, exc_value, exc_traceback):
+    """
+    Installs the rich traceback handler the first time an uncaught exception is raised, so that importing flytekit
+    does not pay for importing rich and pygments when no exception is ever printed.
+    """
+    _install_rich_traceback()
+    sys.excepthook(exc_type, exc_value, exc_traceback)
+
+
+# Pretty-print exception messages
+if not _FAST_IMPORT and os.environ.get(LOGGING_RICH_FMT_ENV_VAR) != "0":
+    if "IPython" in sys.modules:
+        # IPython does not route exceptions through sys.excepthook, rich has to hook into the shell right away.
+        _install_rich_traceback()
+    else:
+        sys.excepthook = _lazy_rich_excepthook
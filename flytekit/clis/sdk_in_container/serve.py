@@ -141,6 +141,7 @@ async def _start_grpc_server(name: str, port: int, prometheus_port: int, worker:
             SyncConnectorService,
         )
         from flytekit.extras.webhook import WebhookConnector  # noqa: F401 Webhook Connector Registration
+        from flytekit.sensor.sensor_engine import SensorEngine  # noqa: F401 Sensor Connector Registration
     except ImportError as e:
         raise ImportError(
             f"Flyte connector dependencies are not installed. Please install it using `pip install flytekit[{name.lower()}]`"
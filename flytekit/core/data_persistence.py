@@ -42,6 +42,22 @@ Uploadable = typing.Union[str, os.PathLike, pathlib.Path, bytes, io.BufferedRead
 # configurable by the user if needed. This is used when put() is called on filesystems.
 _WRITE_SIZE_CHUNK_BYTES = int(os.environ.get("_F_P_WRITE_CHUNK_SIZE", "26214400"))  # 25 * 2**20
 
+# Number of multipart upload parts s3fs sends concurrently when put() is called on a large file. s3fs picks its own
+# default when this is not set, and only versions newer than 2024.3 accept it, so it is only passed when set.
+_WRITE_MAX_CONCURRENCY = os.environ.get("_F_P_WRITE_MAX_CONCURRENCY")
+
+# Single files at least this large that live in an object store are downloaded as concurrent byte range requests
+# instead of a single stream, since a single connection to S3 or GCS is throughput capped well below what the node
+# can sustain. The ranges are _READ_CHUNK_BYTES each and at most _READ_MAX_CONCURRENCY of them are in flight at once.
+# Finding out the size of a file costs an extra metadata request on every download, which workloads made of many small
+# files should not pay, so this is off unless _F_P_READ_PARALLEL_THRESHOLD is set (e.g. to 67108864 for 64MiB).
+_READ_PARALLEL_THRESHOLD_BYTES = (
+    int(os.environ["_F_P_READ_PARALLEL_THRESHOLD"]) if os.environ.get("_F_P_READ_PARALLEL_THRESHOLD") else None
+)
+_READ_CHUNK_BYTES = int(os.environ.get("_F_P_READ_CHUNK_SIZE", "16777216"))  # 16 * 2**20
+_READ_MAX_CONCURRENCY = int(os.environ.get("_F_P_READ_MAX_CONCURRENCY", "8"))
+_RANGED_READ_PROTOCOLS = frozenset({"s3", "s3a", "gs", "gcs", "abfs", "abfss", "az"})
+
 
 def s3_setup_args(s3_cfg: configuration.S3Config, anonymous: bool = False) -> Dict[str, Any]:
     kwargs: Dict[str, Any] = {
@@ -115,6 +131,8 @@ def get_additional_fsspec_call_kwargs(protocol: typing.Union[str, tuple], method
     # Re-evaluate these kwargs when we move off of s3fs to obstore.
     if method_name == "put" and protocol in ["s3", "gs"]:
         kwargs["chunksize"] = _WRITE_SIZE_CHUNK_BYTES
+        if protocol == "s3" and _WRITE_MAX_CONCURRENCY:
+            kwargs["max_concurrency"] = int(_WRITE_MAX_CONCURRENCY)
 
     return kwargs
 
@@ -243,10 +261,11 @@ class FileAccessProvider(object):
         """
         Deprecated. Let's find a replacement
         """
-        protocol = get_protocol(str(path))
-        if protocol is None:
+        path = str(path)
+        # Most paths are plain local paths, skip the regex based protocol parsing when there is no protocol separator.
+        if "://" not in path and "::" not in path:
             return False
-        return protocol != "file"
+        return get_protocol(path) != "file"
 
     @property
     def local_sandbox_dir(self) -> os.PathLike:
@@ -317,6 +336,8 @@ class FileAccessProvider(object):
                     self.strip_file_header(from_path), self.strip_file_header(to_path), dirs_exist_ok=True
                 )
             logger.info(f"Getting {from_path} to {to_path}")
+            if not recursive and not kwargs and await self._get_file_in_ranges(file_system, from_path, to_path):
+                return to_path
             if isinstance(file_system, AsyncFileSystem):
                 dst = await file_system._get(from_path, to_path, recursive=recursive, **kwargs)  # pylint: disable=W0212
             else:
@@ -341,6 +362,60 @@ class FileAccessProvider(object):
                     return file_system.get(from_path, to_path, recursive=recursive, **kwargs)
             raise oe
 
+    async def _get_file_in_ranges(self, file_system: fsspec.AbstractFileSystem, from_path: str, to_path: str) -> bool:
+        """
+        Downloads a single large object store file as concurrent byte range requests, each written straight to its
+        offset in the local file. Returns False without doing anything if the file is not eligible, in which case the
+        caller should fall back to a regular get.
+        """
+        if (
+            _READ_PARALLEL_THRESHOLD_BYTES is None
+            or not hasattr(os, "pwrite")
+            or not isinstance(file_system, AsyncFileSystem)
+            or get_protocol(from_path) not in _RANGED_READ_PROTOCOLS
+        ):
+            return False
+        info = await file_system._info(from_path)  # pylint: disable=W0212
+        size = info.get("size")
+        if info.get("type") != "file" or size is None or size < _READ_PARALLEL_THRESHOLD_BYTES:
+            return False
+
+        if os.path.isdir(to_path):
+            to_path = os.path.join(to_path, os.path.basename(from_path.rstrip("/")))
+        logger.debug(f"Downloading {from_path} ({size} bytes) in ranges of {_READ_CHUNK_BYTES} bytes")
+        semaphore = asyncio.Semaphore(_READ_MAX_CONCURRENCY)
+        os.makedirs(os.path.dirname(to_path) or ".", exist_ok=True)
+        fd = os.open(to_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+        async def _get_range(start: int):
+            async with semaphore:
+                data = await file_system._cat_file(  # pylint: disable=W0212
+                    from_path, start=start, end=min(start + _READ_CHUNK_BYTES, size)
+                )
+            # pwrite may write less than it was given
+            view = memoryview(data)
+            while view:
+                written = os.pwrite(fd, view, start)
+                view = view[written:]
+                start += written
+
+        tasks = []
+        try:
+            os.ftruncate(fd, size)
+            tasks = [asyncio.create_task(_get_range(start)) for start in range(0, size, _READ_CHUNK_BYTES)]
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # gather does not cancel the other ranges when one fails, they must be stopped before the fd is closed or
+            # they would write into whatever file reuses that fd number next
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            os.close(fd)
+            os.remove(to_path)
+            raise
+        os.close(fd)
+        return True
+
     @retry_request
     async def _put(self, from_path: str, to_path: str, recursive: bool = False, **kwargs):
         """
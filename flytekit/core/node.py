@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import logging
+import operator
 import typing
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 from typing import Literal as L
 
 from flyteidl.core import tasks_pb2
@@ -22,15 +25,24 @@ from flytekit.models import literals as _literal_models
 from flytekit.models.core import workflow as _workflow_model
 from flytekit.models.task import Resources as _resources_model
 
+if typing.TYPE_CHECKING:
+    from flytekit.core.promise import Promise
+
+
+@functools.lru_cache(maxsize=None)
+def _get_promise_cls() -> typing.Type[Promise]:
+    # flytekit.core.promise imports this module, so Promise can only be imported once both modules are loaded.
+    from flytekit.core.promise import Promise
+
+    return Promise
+
 
 def assert_not_promise(v: Any, location: str):
     """
     This function will raise an exception if the value is a promise. This should be used to ensure that we don't
     accidentally use a promise in a place where we don't support it.
     """
-    from flytekit.core.promise import Promise
-
-    if isinstance(v, Promise):
+    if isinstance(v, _get_promise_cls()):
         raise AssertionError(f"Cannot use a promise in the {location} Value: {v}")
 
 
@@ -41,12 +53,43 @@ def assert_no_promises_in_resources(resources: _resources_model):
     """
     if resources is None:
         return
-    if resources.requests is not None:
-        for r in resources.requests:
-            assert_not_promise(r.value, "resources.requests")
-    if resources.limits is not None:
-        for r in resources.limits:
-            assert_not_promise(r.value, "resources.limits")
+    promise_cls = _get_promise_cls()
+    for location, entries in (("resources.requests", resources.requests), ("resources.limits", resources.limits)):
+        for r in entries or ():
+            if isinstance(r.value, promise_cls):
+                raise AssertionError(f"Cannot use a promise in the {location} Value: {r.value}")
+
+
+# timedelta and RetryStrategy are never mutated once attached to the node metadata, so overrides that use the same
+# value can share one instance.
+_ZERO_TIMEDELTA = datetime.timedelta()
+_ZERO_RETRY = _literal_models.RetryStrategy(0)
+
+
+@functools.lru_cache(maxsize=128)
+def _timeout_from_seconds(seconds: int) -> datetime.timedelta:
+    return datetime.timedelta(seconds=seconds)
+
+
+@functools.lru_cache(maxsize=16)
+def _retry_strategy(retries: int) -> _literal_models.RetryStrategy:
+    return _literal_models.RetryStrategy(retries)
+
+
+@functools.lru_cache(maxsize=None)
+def _run_entity_accessor(entity_type: type) -> Optional[Callable[[Any], Any]]:
+    """
+    Returns the function that extracts the entity that actually runs from a node's flyte entity of the given type, or
+    None if the entity runs itself. Resolved once per type, so Node.run_entity is a single dict lookup.
+    """
+    from flytekit.core.array_node_map_task import ArrayNodeMapTask
+    from flytekit.core.legacy_map_task import MapPythonTask
+
+    if issubclass(entity_type, MapPythonTask):
+        return operator.attrgetter("run_task")
+    if issubclass(entity_type, ArrayNodeMapTask):
+        return operator.attrgetter("python_function_task")
+    return None
 
 
 class Node(object):
@@ -57,6 +100,25 @@ class Node(object):
 
     TIMEOUT_OVERRIDE_SENTINEL = object()
 
+    # Large workflows (e.g. dynamic workflows) can create thousands of nodes, so keep the known attributes in slots.
+    # ``__dict__`` is still allowed because create_node attaches the output promises to the node as attributes; it is
+    # only allocated for those nodes.
+    __slots__ = (
+        "_id",
+        "_metadata",
+        "_bindings",
+        "_upstream_nodes",
+        "_upstream_node_set",
+        "_flyte_entity",
+        "_aliases",
+        "_outputs",
+        "_resources",
+        "_extended_resources",
+        "_container_image",
+        "_pod_template",
+        "__dict__",
+    )
+
     def __init__(
         self,
         id: str,
@@ -71,8 +133,11 @@ class Node(object):
         self._metadata = metadata
         self._bindings = bindings
         self._upstream_nodes = upstream_nodes
+        # Mirrors _upstream_nodes (which keeps the insertion order) so that runs_before does not scan the list on every
+        # call. Nodes hash by identity.
+        self._upstream_node_set: typing.Set[Node] = set(upstream_nodes)
         self._flyte_entity = flyte_entity
-        self._aliases: _workflow_model.Alias = None
+        self._aliases: typing.Optional[typing.List[_workflow_model.Alias]] = None
         self._outputs = None
         self._resources: typing.Optional[_resources_model] = None
         self._extended_resources: typing.Optional[tasks_pb2.ExtendedResources] = None
@@ -87,7 +152,8 @@ class Node(object):
         other direction is not implemented to further avoid confusion. Right shift was picked rather than left shift
         because that's what most users are familiar with.
         """
-        if self not in other._upstream_nodes:
+        if self not in other._upstream_node_set:
+            other._upstream_node_set.add(self)
             other._upstream_nodes.append(self)
 
     def __rshift__(self, other: Node):
@@ -122,14 +188,10 @@ class Node(object):
 
     @property
     def run_entity(self) -> Any:
-        from flytekit.core.array_node_map_task import ArrayNodeMapTask
-        from flytekit.core.legacy_map_task import MapPythonTask
-
-        if isinstance(self.flyte_entity, MapPythonTask):
-            return self.flyte_entity.run_task
-        if isinstance(self.flyte_entity, ArrayNodeMapTask):
-            return self.flyte_entity.python_function_task
-        return self.flyte_entity
+        accessor = _run_entity_accessor(type(self._flyte_entity))
+        if accessor is None:
+            return self._flyte_entity
+        return accessor(self._flyte_entity)
 
     @property
     def metadata(self) -> _workflow_model.NodeMetadata:
@@ -161,9 +223,9 @@ class Node(object):
 
         if timeout is not Node.TIMEOUT_OVERRIDE_SENTINEL:
             if timeout is None:
-                node_metadata._timeout = datetime.timedelta()
+                node_metadata._timeout = _ZERO_TIMEDELTA
             elif isinstance(timeout, int):
-                node_metadata._timeout = datetime.timedelta(seconds=timeout)
+                node_metadata._timeout = _timeout_from_seconds(timeout)
             elif isinstance(timeout, datetime.timedelta):
                 node_metadata._timeout = timeout
             else:
@@ -171,9 +233,7 @@ class Node(object):
 
         if retries is not None:
             assert_not_promise(retries, "retries")
-            node_metadata._retries = (
-                _literal_models.RetryStrategy(0) if retries is None else _literal_models.RetryStrategy(retries)
-            )
+            node_metadata._retries = _ZERO_RETRY if retries is None else _retry_strategy(retries)
 
         if interruptible is not None:
             assert_not_promise(interruptible, "interruptible")
@@ -188,7 +248,7 @@ class Node(object):
             # Note: any future changes should look into how these cache params are set in tasks
             # If the cache is of type bool but cache_version is not set, then assume that we want to use the
             # default cache policies in Cache
-            if isinstance(cache, bool) and cache is True and cache_version is None:
+            if cache is True and cache_version is None:
                 cache = Cache(
                     serialize=cache_serialize if cache_serialize is not None else False,
                     ignored_inputs=cache_ignore_input_vars if cache_ignore_input_vars is not None else tuple(),
@@ -240,18 +300,29 @@ class Node(object):
         *args,
         **kwargs,
     ):
+        # Overrides are applied at compile time, so none of them can come from a promise. Validate them in one pass
+        # before anything on the node is modified.
+        promise_cls = _get_promise_cls()
+        for value, location in (
+            (node_name, "node_name"),
+            (container_image, "container_image"),
+            (accelerator, "accelerator"),
+            (shared_memory, "shared_memory"),
+            (pod_template, "podtemplate"),
+        ):
+            if isinstance(value, promise_cls):
+                raise AssertionError(f"Cannot use a promise in the {location} Value: {value}")
+
         if node_name is not None:
             # Convert the node name into a DNS-compliant.
             # https://kubernetes.io/docs/concepts/overview/working-with-objects/names/#dns-subdomain-names
-            assert_not_promise(node_name, "node_name")
-            self._id = _dnsify(node_name)
+            if node_name != self._id:
+                self._id = _dnsify(node_name)
 
         if aliases is not None:
             if not isinstance(aliases, dict):
                 raise AssertionError("Aliases should be specified as dict[str, str]")
-            self._aliases = []
-            for k, v in aliases.items():
-                self._aliases.append(_workflow_model.Alias(var=k, alias=v))
+            self._aliases = [_workflow_model.Alias(var=k, alias=v) for k, v in aliases.items()]
 
         if resources is not None:
             if limits is not None or requests is not None:
@@ -267,12 +338,13 @@ class Node(object):
             if limits and not isinstance(limits, Resources):
                 raise AssertionError("limits should be specified as flytekit.Resources")
 
-            if not limits:
+            # short_string() is only worth computing if the warning is going to be emitted.
+            if not limits and logger.isEnabledFor(logging.WARNING):
                 logger.warning(
-                    (
-                        f"Requests overridden on node {self.id} ({self.metadata.short_string()}) without specifying limits. "
-                        "Requests are clamped to original limits."
-                    )
+                    "Requests overridden on node %s (%s) without specifying limits. "
+                    "Requests are clamped to original limits.",
+                    self.id,
+                    self.metadata.short_string(),
                 )
 
             resources_ = convert_resources_to_resource_model(requests=requests, limits=limits)
@@ -286,48 +358,38 @@ class Node(object):
             self.run_entity._task_config = task_config
 
         if container_image is not None:
-            assert_not_promise(container_image, "container_image")
             self._container_image = container_image
 
-        if accelerator is not None:
-            assert_not_promise(accelerator, "accelerator")
-
-        if shared_memory is not None:
-            assert_not_promise(shared_memory, "shared_memory")
-
-        self._extended_resources = construct_extended_resources(accelerator=accelerator, shared_memory=shared_memory)
+        if accelerator is not None or shared_memory is not None:
+            self._extended_resources = construct_extended_resources(
+                accelerator=accelerator, shared_memory=shared_memory
+            )
 
         self._override_node_metadata(name, timeout, retries, interruptible, cache, **kwargs)
 
         if pod_template is not None:
-            assert_not_promise(pod_template, "podtemplate")
             self._pod_template = pod_template
 
         return self
 
 
+# (attribute on flytekit.Resources, resource name in the IDL), in the order the entries are emitted.
+_RESOURCE_FIELDS = (
+    ("cpu", _resources_model.ResourceName.CPU),
+    ("mem", _resources_model.ResourceName.MEMORY),
+    ("gpu", _resources_model.ResourceName.GPU),
+    ("ephemeral_storage", _resources_model.ResourceName.EPHEMERAL_STORAGE),
+)
+
+
 def _convert_resource_overrides(
     resources: typing.Optional[Resources], resource_name: str
 ) -> typing.List[_resources_model.ResourceEntry]:
     if resources is None:
         return []
 
-    resource_entries = []
-    if resources.cpu is not None:
-        resource_entries.append(_resources_model.ResourceEntry(_resources_model.ResourceName.CPU, resources.cpu))
-
-    if resources.mem is not None:
-        resource_entries.append(_resources_model.ResourceEntry(_resources_model.ResourceName.MEMORY, resources.mem))
-
-    if resources.gpu is not None:
-        resource_entries.append(_resources_model.ResourceEntry(_resources_model.ResourceName.GPU, resources.gpu))
-
-    if resources.ephemeral_storage is not None:
-        resource_entries.append(
-            _resources_model.ResourceEntry(
-                _resources_model.ResourceName.EPHEMERAL_STORAGE,
-                resources.ephemeral_storage,
-            )
-        )
-
-    return resource_entries
+    return [
+        _resources_model.ResourceEntry(name, value)
+        for attr, name in _RESOURCE_FIELDS
+        if (value := getattr(resources, attr)) is not None
+    ]
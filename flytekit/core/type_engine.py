@@ -2215,7 +2215,7 @@ class DictTransformer(AsyncTypeTransformer[dict]):
                 from flytekit.types.pickle import FlytePickle
 
                 uri = json.loads(_json_format.MessageToJson(lv.scalar.generic)).get("pickle_file")
-                return await FlytePickle.from_pickle(uri)
+                return await FlytePickle.from_pickle(uri, ctx)
 
             try:
                 """
@@ -2757,6 +2757,9 @@ def is_annotated(t: Type) -> bool:
 
 def get_underlying_type(t: Type) -> Type:
     """Return the underlying type for annotated types or the type itself"""
+    # Plain classes are by far the most common input and can never be Annotated, skip the get_origin probing for them
+    if isinstance(t, type):
+        return t
     if is_annotated(t):
         return get_args(t)[0]
     return t
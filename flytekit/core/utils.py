@@ -2,6 +2,7 @@ import copy
 import datetime
 import inspect
 import os
+import re
 import shutil
 import tempfile
 import time
@@ -22,6 +23,10 @@ from flytekit.loggers import logger
 if TYPE_CHECKING:
     from flytekit.models import task as task_models
 
+# Values matching this are returned unchanged by _dnsify. The length is capped at 62 because _dnsify hashes values of 63
+# characters or more.
+_DNS_LABEL_RE = re.compile(r"[a-z0-9]([-a-z0-9]{0,60}[a-z0-9])?")
+
 
 def _dnsify(value: str) -> str:
     """
@@ -32,6 +37,9 @@ def _dnsify(value: str) -> str:
     :param Text value:
     :rtype: Text
     """
+    if _DNS_LABEL_RE.fullmatch(value):
+        return value
+
     res = ""
     MAX = 63
     HASH_LEN = 10
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import json
 import mimetypes
 import os
 import pathlib
+import types
 import typing
-from contextlib import contextmanager
 from dataclasses import dataclass, field
-from functools import partial
+from functools import lru_cache, partial
 from typing import Dict, cast
 from urllib.parse import unquote
 
@@ -30,7 +29,6 @@ from flytekit.core.type_engine import (
 from flytekit.exceptions.user import FlyteAssertion
 from flytekit.extras.pydantic_transformer.decorator import model_serializer, model_validator
 from flytekit.loggers import logger
-from flytekit.models.core import types as _core_types
 from flytekit.models.core.types import BlobType
 from flytekit.models.literals import Binary, Blob, BlobMetadata, Literal, Scalar
 from flytekit.models.types import LiteralType
@@ -40,6 +38,47 @@ from flytekit.types.pickle.pickle import FlytePickleTransformer
 def noop(): ...
 
 
+@lru_cache(maxsize=None)
+def _extension_to_mime_type() -> typing.Dict[str, typing.Union[str, typing.Sequence[str]]]:
+    extension_to_mime_type: typing.Dict[str, typing.Union[str, typing.Sequence[str]]] = {
+        "hdf5": "text/plain",
+        "joblib": "application/octet-stream",
+        "python_pickle": "application/octet-stream",
+        "ipynb": "application/json",
+        "onnx": "application/json",
+        "tfrecord": "application/octet-stream",
+        "jsonl": ["application/json", "application/x-ndjson"],
+    }
+
+    for ext, mimetype in mimetypes.types_map.items():
+        extension_to_mime_type[ext.split(".")[1]] = mimetype
+
+    return extension_to_mime_type
+
+
+@lru_cache(maxsize=None)
+def _import_magic() -> typing.Optional[types.ModuleType]:
+    try:
+        # isolate the exception to the libmagic import
+        import magic
+    except ImportError as e:
+        logger.debug(f"Libmagic is not installed. Error message: {e}")
+        return None
+    return magic
+
+
+@lru_cache(maxsize=128)
+def _single_blob_metadata(format: str) -> BlobMetadata:
+    # BlobMetadata and BlobType are immutable, so every literal of the same format can share one instance
+    return BlobMetadata(type=BlobType(format=format, dimensionality=BlobType.BlobDimensionality.SINGLE))
+
+
+def _single_blob_literal(
+    uri: typing.Union[str, os.PathLike], metadata: typing.Optional[typing.Dict[str, str]] = None, format: str = ""
+) -> Literal:
+    return Literal(scalar=Scalar(blob=Blob(metadata=_single_blob_metadata(format), uri=uri)), metadata=metadata)
+
+
 T = typing.TypeVar("T")
 
 
@@ -185,19 +224,7 @@ class FlyteFile(SerializableType, os.PathLike, typing.Generic[T], DataClassJSONM
 
         pv = FlyteFilePathTransformer().to_python_value(
             FlyteContextManager.current_context(),
-            Literal(
-                scalar=Scalar(
-                    blob=Blob(
-                        metadata=BlobMetadata(
-                            type=_core_types.BlobType(
-                                format="", dimensionality=_core_types.BlobType.BlobDimensionality.SINGLE
-                            )
-                        ),
-                        uri=self.path,
-                    )
-                ),
-                metadata=self.metadata,
-            ),
+            _single_blob_literal(self.path, self.metadata),
             type(self),
         )
         return pv
@@ -224,14 +251,7 @@ class FlyteFile(SerializableType, os.PathLike, typing.Generic[T], DataClassJSONM
         Create a new FlyteFile object with the remote source set to the input
         """
         ctx = FlyteContextManager.current_context()
-        lit = Literal(
-            scalar=Scalar(
-                blob=Blob(
-                    metadata=BlobMetadata(type=BlobType(format="", dimensionality=BlobType.BlobDimensionality.SINGLE)),
-                    uri=source,
-                )
-            )
-        )
+        lit = _single_blob_literal(source)
         t = FlyteFilePathTransformer()
         return t.to_python_value(ctx, lit, cls)
 
@@ -262,27 +282,7 @@ class FlyteFile(SerializableType, os.PathLike, typing.Generic[T], DataClassJSONM
         if item == "":
             return cls
 
-        class _SpecificFormatClass(FlyteFile):
-            # Get the type engine to see this as kind of a generic
-            __origin__ = FlyteFile
-
-            class AttributeHider:
-                def __get__(self, instance, owner):
-                    raise AttributeError(
-                        """We have to return false in hasattr(cls, "__class_getitem__") to make mashumaro deserialize FlyteFile correctly."""
-                    )
-
-            # Set __class_getitem__ to AttributeHider to make mashumaro deserialize FlyteFile correctly
-            # https://stackoverflow.com/questions/6057130/python-deleting-a-class-attribute-in-a-subclass/6057409
-            # Since mashumaro will use the method __class_getitem__ and __origin__ to construct the dataclass back
-            # https://github.com/Fatal1ty/mashumaro/blob/e945ee4319db49da9f7b8ede614e988cc8c8956b/mashumaro/core/meta/helpers.py#L300-L303
-            __class_getitem__ = AttributeHider()  # type: ignore
-
-            @classmethod
-            def extension(cls) -> str:
-                return item_string
-
-        return _SpecificFormatClass
+        return _specific_format_file_class(item_string)
 
     def __init__(
         self,
@@ -309,21 +309,49 @@ class FlyteFile(SerializableType, os.PathLike, typing.Generic[T], DataClassJSONM
         self._downloaded = False
         self._remote_path = remote_path
         self._remote_source: typing.Optional[typing.Union[str, os.PathLike]] = None
+        # (path, hash) of the last hashed path, path is a public mutable field so the hash is keyed on it
+        self._hash_cache: typing.Optional[typing.Tuple[typing.Union[str, os.PathLike], int]] = None
 
         # Setup local path and downloader for delayed downloading
         # We introduce another attribute self._local_path to avoid overriding user-defined self.path
         self._local_path = self.path
 
+        self._remote_ctx: typing.Optional[FlyteContext] = None
+
         ctx = FlyteContextManager.current_context()
         if ctx.file_access.is_remote(self.path):
             self._remote_source = self.path
-            self._local_path = ctx.file_access.get_random_local_path(self._remote_source)
-            self._downloader = partial(
-                ctx.file_access.get_data,
-                ctx=ctx,
-                remote_path=self._remote_source,  # type: ignore
-                local_path=self._local_path,
-            )
+            # Many remote files are only passed along and never opened, so the local path and the downloader are set
+            # up on first access in __fspath__, using the context the file was created in.
+            self._local_path = None
+            self._remote_ctx = ctx
+
+    def _setup_remote_download(self):
+        ctx = typing.cast(FlyteContext, self._remote_ctx)
+        self._remote_ctx = None
+        file_access = ctx.file_access
+        self._local_path = file_access.get_random_local_path(self._remote_source)
+        # Extra kwargs are forwarded to the filesystem's get and keep it from using ranged downloads, pass none
+        self._downloader = partial(
+            file_access.get_data,
+            remote_path=self._remote_source,  # type: ignore
+            local_path=self._local_path,
+        )
+
+    def __getstate__(self):
+        # The context cannot be pickled, so a remote file that was never accessed gets its downloader set up now
+        if self._remote_ctx is not None:
+            self._setup_remote_download()
+        state = self.__dict__.copy()
+        # str hashes are salted per process, a cached hash must not travel to another one
+        state["_hash_cache"] = None
+        return state
+
+    def __setstate__(self, state):
+        # FlyteFiles pickled by older flytekit versions do not have the attributes added since
+        state.setdefault("_remote_ctx", None)
+        state.setdefault("_hash_cache", None)
+        self.__dict__.update(state)
 
     def __fspath__(self):
         """
@@ -352,13 +380,28 @@ class FlyteFile(SerializableType, os.PathLike, typing.Generic[T], DataClassJSONM
         For details, please refer to this issue: https://github.com/flyteorg/flyte/issues/6090.
         """
         if not self._downloaded:
+            if self._remote_ctx is not None:
+                self._setup_remote_download()
             # Download data from remote to local or run dummy downloading for input local path
             self._downloader()
             self._downloaded = True
         return self._local_path
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, FlyteFile):
+            # Files whose paths were already hashed can be told apart without comparing the paths
+            hash_cache = getattr(self, "_hash_cache", None)
+            other_hash_cache = getattr(other, "_hash_cache", None)
+            if (
+                hash_cache is not None
+                and other_hash_cache is not None
+                and hash_cache[0] is self.path
+                and other_hash_cache[0] is other.path
+                and hash_cache[1] != other_hash_cache[1]
+            ):
+                return False
             return (
                 self.path == other.path
                 and self._remote_path == other._remote_path
@@ -390,14 +433,13 @@ class FlyteFile(SerializableType, os.PathLike, typing.Generic[T], DataClassJSONM
     async def _download(self) -> str:
         return self.__fspath__()
 
-    @contextmanager
     def open(
         self,
         mode: str,
         cache_type: typing.Optional[str] = None,
         cache_options: typing.Optional[typing.Dict[str, typing.Any]] = None,
     ):
-        """Returns a streaming File handle
+        """Returns a streaming File handle, which is closed when used as a context manager
 
         ```python
         @task
@@ -425,9 +467,7 @@ class FlyteFile(SerializableType, os.PathLike, typing.Generic[T], DataClassJSONM
         elif self.remote_path:
             final_path = self.remote_path
         fs = ctx.file_access.get_filesystem_for_path(final_path)
-        f = fs.open(final_path, mode, cache_type=cache_type, cache_options=cache_options)
-        yield f
-        f.close()
+        return fs.open(final_path, mode, cache_type=cache_type, cache_options=cache_options)
 
     def __repr__(self):
         return self.path
@@ -436,7 +476,42 @@ class FlyteFile(SerializableType, os.PathLike, typing.Generic[T], DataClassJSONM
         return self.path
 
     def __hash__(self):
-        return hash(str(self.path))
+        path = self.path
+        hash_cache = getattr(self, "_hash_cache", None)
+        if hash_cache is not None and hash_cache[0] is path:
+            return hash_cache[1]
+        h = hash(path if isinstance(path, str) else str(path))
+        self._hash_cache = (path, h)
+        return h
+
+
+@lru_cache(maxsize=512)
+def _specific_format_file_class(item_string: str) -> typing.Type[FlyteFile]:
+    """
+    Returns the FlyteFile subclass for the given format, so that ``FlyteFile["csv"] is FlyteFile["csv"]``.
+    """
+
+    class _SpecificFormatClass(FlyteFile):
+        # Get the type engine to see this as kind of a generic
+        __origin__ = FlyteFile
+
+        class AttributeHider:
+            def __get__(self, instance, owner):
+                raise AttributeError(
+                    """We have to return false in hasattr(cls, "__class_getitem__") to make mashumaro deserialize FlyteFile correctly."""
+                )
+
+        # Set __class_getitem__ to AttributeHider to make mashumaro deserialize FlyteFile correctly
+        # https://stackoverflow.com/questions/6057130/python-deleting-a-class-attribute-in-a-subclass/6057409
+        # Since mashumaro will use the method __class_getitem__ and __origin__ to construct the dataclass back
+        # https://github.com/Fatal1ty/mashumaro/blob/e945ee4319db49da9f7b8ede614e988cc8c8956b/mashumaro/core/meta/helpers.py#L300-L303
+        __class_getitem__ = AttributeHider()  # type: ignore
+
+        @classmethod
+        def extension(cls) -> str:
+            return item_string
+
+    return _SpecificFormatClass
 
 
 class FlyteFilePathTransformer(AsyncTypeTransformer[FlyteFile]):
@@ -466,20 +541,7 @@ class FlyteFilePathTransformer(AsyncTypeTransformer[FlyteFile]):
         return LiteralType(blob=self._blob_type(format=FlyteFilePathTransformer.get_format(t)))
 
     def get_mime_type_from_extension(self, extension: str) -> typing.Union[str, typing.Sequence[str]]:
-        extension_to_mime_type = {
-            "hdf5": "text/plain",
-            "joblib": "application/octet-stream",
-            "python_pickle": "application/octet-stream",
-            "ipynb": "application/json",
-            "onnx": "application/json",
-            "tfrecord": "application/octet-stream",
-            "jsonl": ["application/json", "application/x-ndjson"],
-        }
-
-        for ext, mimetype in mimetypes.types_map.items():
-            extension_to_mime_type[ext.split(".")[1]] = mimetype
-
-        return extension_to_mime_type[extension]
+        return _extension_to_mime_type()[extension]
 
     def validate_file_type(
         self, python_type: typing.Type[FlyteFile], source_path: typing.Union[str, os.PathLike]
@@ -493,15 +555,14 @@ class FlyteFilePathTransformer(AsyncTypeTransformer[FlyteFile]):
         :param source_path: The path to the file to validate
         :raises ValueError: If the real type of the file is not the same as the expected python_type
         """
-        if FlyteFilePathTransformer.get_format(python_type) == "":
-            return
+        self._validate_file_format(FlyteFilePathTransformer.get_format(python_type), source_path)
 
-        try:
-            # isolate the exception to the libmagic import
-            import magic
+    def _validate_file_format(self, file_format: str, source_path: typing.Union[str, os.PathLike]) -> None:
+        if file_format == "":
+            return
 
-        except ImportError as e:
-            logger.debug(f"Libmagic is not installed. Error message: {e}")
+        magic = _import_magic()
+        if magic is None:
             return
 
         ctx = FlyteContext.current_context()
@@ -511,11 +572,10 @@ class FlyteFilePathTransformer(AsyncTypeTransformer[FlyteFile]):
             # Therefore, we should only validate FlyteFiles for which their path is considered local.
             return
 
-        if FlyteFilePathTransformer.get_format(python_type):
-            real_type = magic.from_file(source_path, mime=True)
-            expected_type = self.get_mime_type_from_extension(FlyteFilePathTransformer.get_format(python_type))
-            if real_type not in expected_type:
-                raise ValueError(f"Incorrect file type, expected {expected_type}, got {real_type}")
+        real_type = magic.from_file(source_path, mime=True)
+        expected_type = self.get_mime_type_from_extension(file_format)
+        if real_type not in expected_type:
+            raise ValueError(f"Incorrect file type, expected {expected_type}, got {real_type}")
 
     async def async_to_literal(
         self,
@@ -526,6 +586,7 @@ class FlyteFilePathTransformer(AsyncTypeTransformer[FlyteFile]):
     ) -> Literal:
         remote_path = None
         should_upload = True
+        file_access = ctx.file_access
 
         if python_val is None:
             raise TypeTransformerFailedError("None value cannot be converted to a file.")
@@ -537,25 +598,24 @@ class FlyteFilePathTransformer(AsyncTypeTransformer[FlyteFile]):
             raise ValueError(f"Incorrect type {python_type}, must be either a FlyteFile or os.PathLike")
 
         # information used by all cases
-        meta = BlobMetadata(type=self._blob_type(format=FlyteFilePathTransformer.get_format(python_type)))
+        file_format = FlyteFilePathTransformer.get_format(python_type)
 
         if isinstance(python_val, FlyteFile):
             # Cast the source path to str type to avoid error raised when the source path is used as the blob uri,
             # please refer to this issue: https://github.com/flyteorg/flyte/issues/5872.
-            source_path = str(python_val.path)
-            self.validate_file_type(python_type, source_path)
+            path = python_val.path
+            source_path = path if type(path) is str else str(path)
+            self._validate_file_format(file_format, source_path)
 
             # If the object has a remote source, then we just convert it back. This means that if someone is just
             # going back and forth between a FlyteFile Python value and a Blob Flyte IDL value, we don't do anything.
             if python_val._remote_source is not None:
-                return Literal(
-                    scalar=Scalar(blob=Blob(metadata=meta, uri=python_val._remote_source)), metadata=python_val.metadata
-                )
+                return _single_blob_literal(python_val._remote_source, python_val.metadata, file_format)
 
             # If the user specified the remote_path to be False, that means no matter what, do not upload. Also if the
             # path given is already a remote path, say https://www.google.com, the concept of uploading to the Flyte
             # blob store doesn't make sense.
-            if python_val.remote_path is False or ctx.file_access.is_remote(source_path):
+            if python_val.remote_path is False or file_access.is_remote(source_path):
                 should_upload = False
             # If the type that's given is a simpler type, we also don't upload, and print a warning too.
             if python_type is os.PathLike:
@@ -572,19 +632,20 @@ class FlyteFilePathTransformer(AsyncTypeTransformer[FlyteFile]):
                 should_upload = False
 
         elif isinstance(python_val, pathlib.Path) or isinstance(python_val, str):
-            source_path = str(python_val)
+            source_path = python_val if type(python_val) is str else os.fspath(python_val)
             if issubclass(python_type, FlyteFile):
-                self.validate_file_type(python_type, source_path)
-                if ctx.file_access.is_remote(source_path):
+                self._validate_file_format(file_format, source_path)
+                if file_access.is_remote(source_path):
                     should_upload = False
                 else:
-                    if isinstance(python_val, pathlib.Path) and not python_val.is_file():
+                    # source_path is the same path as a str, checking it avoids building another Path object
+                    is_file = os.path.isfile(source_path)
+                    if isinstance(python_val, pathlib.Path) and not is_file:
                         raise ValueError(f"Error converting pathlib.Path {python_val} because it's not a file.")
 
                     # If it's a string pointing to a local destination, then make sure it's a file.
                     if isinstance(python_val, str):
-                        p = pathlib.Path(python_val)
-                        if not p.is_file():
+                        if not is_file:
                             raise TypeTransformerFailedError(f"Error converting {python_val} because it's not a file.")
                         if ctx.execution_state.is_local_execution():
                             should_upload = False
@@ -599,25 +660,19 @@ class FlyteFilePathTransformer(AsyncTypeTransformer[FlyteFile]):
         if should_upload:
             headers = self.get_additional_headers(source_path)
             if remote_path is not None:
-                remote_path = await ctx.file_access.async_put_data(
-                    source_path, remote_path, is_multipart=False, **headers
-                )
+                remote_path = await file_access.async_put_data(source_path, remote_path, is_multipart=False, **headers)
             else:
-                remote_path = await ctx.file_access.async_put_raw_data(source_path, **headers)
+                remote_path = await file_access.async_put_raw_data(source_path, **headers)
             # If the source path is a local file, the remote path will be a remote storage path.
-            return Literal(
-                scalar=Scalar(blob=Blob(metadata=meta, uri=unquote(str(remote_path)))),
-                metadata=getattr(python_val, "metadata", None),
-            )
+            return _single_blob_literal(unquote(str(remote_path)), getattr(python_val, "metadata", None), file_format)
         # If not uploading, then we can only take the original source path as the uri.
         else:
-            return Literal(
-                scalar=Scalar(blob=Blob(metadata=meta, uri=source_path)), metadata=getattr(python_val, "metadata", None)
-            )
+            return _single_blob_literal(source_path, getattr(python_val, "metadata", None), file_format)
 
     @staticmethod
     def get_additional_headers(source_path: str | os.PathLike) -> typing.Dict[str, str]:
-        if str(source_path).endswith(".gz"):
+        # async_to_literal always passes a str, only convert other path types
+        if (source_path if isinstance(source_path, str) else os.fspath(source_path)).endswith(".gz"):
             return {"ContentEncoding": "gzip"}
         return {}
 
@@ -632,19 +687,7 @@ class FlyteFilePathTransformer(AsyncTypeTransformer[FlyteFile]):
 
         return self.to_python_value(
             FlyteContextManager.current_context(),
-            Literal(
-                scalar=Scalar(
-                    blob=Blob(
-                        metadata=BlobMetadata(
-                            type=_core_types.BlobType(
-                                format="", dimensionality=_core_types.BlobType.BlobDimensionality.SINGLE
-                            )
-                        ),
-                        uri=path,
-                    )
-                ),
-                metadata=metadata,
-            ),
+            _single_blob_literal(path, metadata),
             expected_python_type,
         )
 
@@ -707,8 +750,17 @@ class FlyteFilePathTransformer(AsyncTypeTransformer[FlyteFile]):
         - Title: Override Dataclass Serialization/Deserialization Behavior for FlyteTypes via Mashumaro
         - Link: https://github.com/flyteorg/flytekit/pull/2554
         """
-        json_str = _json_format.MessageToJson(generic)
-        python_val = json.loads(json_str)
+        # Only "path" and "metadata" are read, pick them out of the Struct instead of converting all of it.
+        fields = generic.fields
+        python_val: typing.Dict[str, typing.Any] = {}
+        for key in ("path", "metadata"):
+            value = fields.get(key)
+            if value is not None:
+                python_val[key] = (
+                    value.string_value
+                    if value.WhichOneof("kind") == "string_value"
+                    else _json_format.MessageToDict(value)
+                )
         return self.dict_to_flyte_file(dict_obj=python_val, expected_python_type=expected_python_type)
 
     async def async_to_python_value(
@@ -730,7 +782,9 @@ class FlyteFilePathTransformer(AsyncTypeTransformer[FlyteFile]):
         if lv.scalar.blob.metadata.type.dimensionality != BlobType.BlobDimensionality.SINGLE:
             raise TypeTransformerFailedError(f"{lv.scalar.blob.uri} is not a file.")
 
-        if not ctx.file_access.is_remote(uri) and not os.path.isfile(uri):
+        file_access = ctx.file_access
+        is_remote = file_access.is_remote(uri)
+        if not is_remote and not os.path.isfile(uri):
             raise FlyteAssertion(
                 f"Cannot convert from {lv} to {expected_python_type}. " f"Expected a file, but {uri} is not a file."
             )
@@ -749,16 +803,18 @@ class FlyteFilePathTransformer(AsyncTypeTransformer[FlyteFile]):
 
         # This is a local file path, like /usr/local/my_file, don't mess with it. Certainly, downloading it doesn't
         # make any sense.
-        if not ctx.file_access.is_remote(uri):
+        if not is_remote:
             return expected_python_type(path=uri, metadata=metadata)  # type: ignore
 
         # For the remote case, return an FlyteFile object that can download
-        local_path = ctx.file_access.get_random_local_path(uri)
+        local_path = file_access.get_random_local_path(uri)
 
-        _downloader = partial(ctx.file_access.get_data, remote_path=uri, local_path=local_path, is_multipart=False)
+        _downloader = partial(file_access.get_data, remote_path=uri, local_path=local_path, is_multipart=False)
 
         expected_format = FlyteFilePathTransformer.get_format(expected_python_type)
-        ff = FlyteFile.__class_getitem__(expected_format)(path=local_path, downloader=_downloader, metadata=metadata)
+        # A plain FlyteFile has no format, there is no specific format class to look up for it.
+        ff_type = FlyteFile.__class_getitem__(expected_format) if expected_format else FlyteFile
+        ff = ff_type(path=local_path, downloader=_downloader, metadata=metadata)
         ff._remote_source = uri
         return ff
 
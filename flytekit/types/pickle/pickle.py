@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import hashlib
 import os
 import typing
@@ -14,6 +16,11 @@ from flytekit.models.types import LiteralType
 T = typing.TypeVar("T")
 
 
+def _load_pickle(path: str) -> typing.Any:
+    with open(path, "rb") as infile:
+        return cloudpickle.load(infile)
+
+
 class FlytePickle(typing.Generic[T]):
     """
     This type is only used by flytekit internally. User should not use this type.
@@ -29,45 +36,66 @@ class FlytePickle(typing.Generic[T]):
         if python_type is None:
             return cls
 
-        class _SpecificFormatClass(FlytePickle):
-            # Get the type engine to see this as kind of a generic
-            __origin__ = FlytePickle
-
-            @classmethod
-            def python_type(cls) -> typing.Type:
-                return python_type
-
-        return _SpecificFormatClass
+        try:
+            return _specific_pickle_class(python_type)
+        except TypeError:
+            # Unhashable type hints cannot be cached
+            return _specific_pickle_class.__wrapped__(python_type)
 
     @classmethod
     async def to_pickle(cls, ctx: FlyteContext, python_val: typing.Any) -> str:
-        h = hashlib.md5()
         str_bytes = cloudpickle.dumps(python_val)
-        h.update(str_bytes)
-
-        uri = ctx.file_access.get_random_local_path(file_path_or_file_name=h.hexdigest())
-        os.makedirs(os.path.dirname(uri), exist_ok=True)
-        with open(uri, "w+b") as outfile:
+        # The digest only names the uploaded file. blake2b is faster than md5 and, unlike md5, is also available on
+        # FIPS enabled systems.
+        h = hashlib.blake2b(str_bytes, digest_size=16)
+
+        # Stage the bytes in a local file, raw bytes would be written with a blocking open() and skip the filesystem's
+        # concurrent multipart put
+        local_path = ctx.file_access.get_random_local_path(file_path_or_file_name=h.hexdigest())
+        os.makedirs(os.path.dirname(local_path), exist_ok=True)
+        with open(local_path, "w+b") as outfile:
             outfile.write(str_bytes)
-
-        return await ctx.file_access.async_put_raw_data(uri)
+        return await ctx.file_access.async_put_raw_data(local_path)
 
     @classmethod
-    async def from_pickle(cls, uri: str) -> typing.Any:
-        ctx = FlyteContextManager.current_context()
+    async def from_pickle(cls, uri: str, ctx: typing.Optional[FlyteContext] = None) -> typing.Any:
+        ctx = ctx or FlyteContextManager.current_context()
         # Deserialize the pickle, and return data in the pickle,
         # and download pickle file to local first if file is not in the local file systems.
         if ctx.file_access.is_remote(uri):
             local_path = ctx.file_access.get_random_local_path()
             await ctx.file_access.async_get_data(uri, local_path, False)
             uri = local_path
-        with open(uri, "rb") as infile:
-            data = cloudpickle.load(infile)
-        return data
+        # Unpickle on a worker thread so that the event loop keeps driving the downloads of other values that are
+        # being converted concurrently, e.g. the other entries of a list or the other task outputs.
+        return await asyncio.to_thread(_load_pickle, uri)
+
+
+@functools.lru_cache(maxsize=512)
+def _specific_pickle_class(python_type: typing.Type) -> typing.Type[FlytePickle]:
+    """
+    Returns the FlytePickle subclass for the given python type, so that ``FlytePickle[T] is FlytePickle[T]``.
+    """
+
+    class _SpecificFormatClass(FlytePickle):
+        # Get the type engine to see this as kind of a generic
+        __origin__ = FlytePickle
+
+        @classmethod
+        def python_type(cls) -> typing.Type:
+            return python_type
+
+    return _SpecificFormatClass
 
 
 class FlytePickleTransformer(AsyncTypeTransformer[FlytePickle]):
     PYTHON_PICKLE_FORMAT = "PythonPickle"
+    # BlobMetadata is read-only, so every pickle literal can share this instance
+    _BLOB_METADATA = BlobMetadata(
+        type=_core_types.BlobType(
+            format=PYTHON_PICKLE_FORMAT, dimensionality=_core_types.BlobType.BlobDimensionality.SINGLE
+        )
+    )
 
     def __init__(self):
         super().__init__(name="FlytePickle", t=FlytePickle)
@@ -78,7 +106,7 @@ class FlytePickleTransformer(AsyncTypeTransformer[FlytePickle]):
 
     async def async_to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
         uri = lv.scalar.blob.uri
-        return await FlytePickle.from_pickle(uri)
+        return await FlytePickle.from_pickle(uri, ctx)
 
     async def async_to_literal(
         self,
@@ -89,13 +117,8 @@ class FlytePickleTransformer(AsyncTypeTransformer[FlytePickle]):
     ) -> Literal:
         if python_val is None:
             raise AssertionError("Cannot pickle None Value.")
-        meta = BlobMetadata(
-            type=_core_types.BlobType(
-                format=self.PYTHON_PICKLE_FORMAT, dimensionality=_core_types.BlobType.BlobDimensionality.SINGLE
-            )
-        )
         remote_path = await FlytePickle.to_pickle(ctx, python_val)
-        return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
+        return Literal(scalar=Scalar(blob=Blob(metadata=self._BLOB_METADATA, uri=remote_path)))
 
     def guess_python_type(self, literal_type: LiteralType) -> typing.Type[FlytePickle[typing.Any]]:
         if (
@@ -1,3 +1,4 @@
+import asyncio
 import io
 import os
 import pathlib
@@ -30,6 +31,9 @@ def test_is_remote():
     assert fp.is_remote("/tmp/foo/bar") is False
     assert fp.is_remote("file://foo/bar") is False
     assert fp.is_remote("s3://my-bucket/foo/bar") is True
+    assert fp.is_remote("gs://my-bucket/foo/bar") is True
+    assert fp.is_remote("file:///tmp/foo/bar") is False
+    assert fp.is_remote(pathlib.Path("/tmp/foo/bar")) is False
 
 
 @pytest.mark.skipif("pandas" not in sys.modules, reason="Pandas is not installed.")
@@ -196,6 +200,13 @@ def test_initialise_azure_file_provider_with_default_credential():
         assert isinstance(fp.get_filesystem().sync_credential, DefaultAzureCredential)
 
 
+def test_get_filesystem_for_path_reuses_instances():
+    # FlyteFile.open resolves a filesystem on every call, this relies on fsspec caching instances by their arguments
+    fp = FileAccessProvider("/tmp", "s3://my-bucket")
+    assert fp.get_filesystem_for_path("s3://my-bucket/a") is fp.get_filesystem_for_path("s3://other-bucket/b")
+    assert fp.get_filesystem_for_path("/tmp/a") is fp.get_filesystem_for_path("/tmp/b")
+
+
 def test_get_file_system():
     # Test that custom args are not swallowed by get_filesystem
 
@@ -222,6 +233,10 @@ def test_get_additional_fsspec_call_kwargs():
         kwargs = get_additional_fsspec_call_kwargs("s3", "get")
         assert kwargs == {}
 
+    with mock.patch("flytekit.core.data_persistence._WRITE_MAX_CONCURRENCY", "16"):
+        assert get_additional_fsspec_call_kwargs("s3", "put")["max_concurrency"] == 16
+        assert "max_concurrency" not in get_additional_fsspec_call_kwargs("gs", "put")
+
 
 @pytest.mark.asyncio
 @mock.patch("flytekit.core.data_persistence.FileAccessProvider.get_async_filesystem_for_path", new_callable=AsyncMock)
@@ -242,6 +257,91 @@ async def test_chunk_size(mock_call_kwargs, mock_get_fs):
     assert upload_location == "s3://bar"
 
 
+@pytest.mark.asyncio
+@mock.patch("flytekit.core.data_persistence._READ_CHUNK_BYTES", 3)
+@mock.patch("flytekit.core.data_persistence._READ_PARALLEL_THRESHOLD_BYTES", 8)
+@mock.patch("flytekit.core.data_persistence.FileAccessProvider.get_async_filesystem_for_path", new_callable=AsyncMock)
+async def test_get_large_file_in_ranges(mock_get_fs):
+    contents = b"0123456789abcdef"
+    ranges = []
+
+    class RangedFileSystem(fsspec.asyn.AsyncFileSystem):
+        async def _info(self, path, **kwargs):
+            return {"name": path, "size": len(contents), "type": "file"}
+
+        async def _cat_file(self, path, start=None, end=None, **kwargs):
+            ranges.append((start, end))
+            return contents[start:end]
+
+    mock_get_fs.return_value = RangedFileSystem()
+    fp = FileAccessProvider("/tmp", "s3://my-bucket")
+    local_path = os.path.join(tempfile.mkdtemp(), "large_file")
+    assert await fp.get("s3://my-bucket/large_file", local_path) == local_path
+
+    with open(local_path, "rb") as f:
+        assert f.read() == contents
+    assert sorted(ranges) == [(0, 3), (3, 6), (6, 9), (9, 12), (12, 15), (15, 16)]
+
+
+@pytest.mark.asyncio
+@mock.patch("flytekit.core.data_persistence._READ_CHUNK_BYTES", 5)
+@mock.patch("flytekit.core.data_persistence._READ_PARALLEL_THRESHOLD_BYTES", 8)
+async def test_get_file_in_ranges_creates_parent_and_handles_short_writes():
+    contents = b"0123456789abcdef"
+
+    class RangedFileSystem(fsspec.asyn.AsyncFileSystem):
+        async def _info(self, path, **kwargs):
+            return {"name": path, "size": len(contents), "type": "file"}
+
+        async def _cat_file(self, path, start=None, end=None, **kwargs):
+            return contents[start:end]
+
+    pwrite = os.pwrite
+    fp = FileAccessProvider("/tmp", "s3://my-bucket")
+    local_path = os.path.join(tempfile.mkdtemp(), "missing", "parent", "large_file")
+    with mock.patch("os.pwrite", side_effect=lambda fd, data, offset: pwrite(fd, data[:2], offset)):
+        assert await fp._get_file_in_ranges(RangedFileSystem(), "s3://my-bucket/large_file", local_path)
+
+    with open(local_path, "rb") as f:
+        assert f.read() == contents
+
+
+@pytest.mark.asyncio
+@mock.patch("flytekit.core.data_persistence._READ_CHUNK_BYTES", 4)
+@mock.patch("flytekit.core.data_persistence._READ_PARALLEL_THRESHOLD_BYTES", 8)
+async def test_get_file_in_ranges_failure_stops_other_ranges():
+    finished = []
+
+    class FailingFileSystem(fsspec.asyn.AsyncFileSystem):
+        async def _info(self, path, **kwargs):
+            return {"name": path, "size": 16, "type": "file"}
+
+        async def _cat_file(self, path, start=None, end=None, **kwargs):
+            if start == 0:
+                raise OSError("range failed")
+            await asyncio.sleep(0.1)
+            finished.append(start)
+            return b"x" * (end - start)
+
+    fp = FileAccessProvider("/tmp", "s3://my-bucket")
+    local_path = os.path.join(tempfile.mkdtemp(), "large_file")
+    with pytest.raises(OSError, match="range failed"):
+        await fp._get_file_in_ranges(FailingFileSystem(), "s3://my-bucket/large_file", local_path)
+
+    await asyncio.sleep(0.2)
+    assert finished == []
+    assert not os.path.exists(local_path)
+
+
+@pytest.mark.asyncio
+@mock.patch("flytekit.core.data_persistence._READ_PARALLEL_THRESHOLD_BYTES", None)
+async def test_get_file_in_ranges_disabled_does_not_probe():
+    file_system = mock.MagicMock(spec=fsspec.asyn.AsyncFileSystem)
+    fp = FileAccessProvider("/tmp", "s3://my-bucket")
+    assert not await fp._get_file_in_ranges(file_system, "s3://my-bucket/file", "/tmp/file")
+    file_system._info.assert_not_called()
+
+
 @pytest.mark.sandbox_test
 def test_put_raw_data_bytes():
     dc = Config.for_sandbox().data_config
@@ -762,6 +762,7 @@ def test_join():
 def test_headers():
     assert FlyteFilePathTransformer.get_additional_headers("xyz") == {}
     assert len(FlyteFilePathTransformer.get_additional_headers(".gz")) == 1
+    assert FlyteFilePathTransformer.get_additional_headers(pathlib.Path("/tmp/a.csv.gz")) == {"ContentEncoding": "gzip"}
 
 
 def test_new_remote_file():
@@ -802,8 +803,86 @@ def test_flyte_file_is_pickleable():
     downstream_input = TypeEngine.to_python_value(
         FlyteContextManager.current_context(), upstream_output, FlyteFile
     )
+    assert type(downstream_input) is FlyteFile
+    assert type(TypeEngine.to_python_value(
+        FlyteContextManager.current_context(), upstream_output, FlyteFile["txt"]
+    )) is FlyteFile["txt"]
 
     # test round trip pickling
     pickled_input = pickle.dumps(downstream_input)
     unpickled_input = pickle.loads(pickled_input)
     assert downstream_input == unpickled_input
+
+
+def test_flyte_file_hash_follows_path():
+    ff = FlyteFile(pathlib.Path("/tmp/foo.txt"))
+    assert hash(ff) == hash("/tmp/foo.txt")
+    assert hash(ff) == hash(FlyteFile("/tmp/foo.txt"))
+
+    ff.path = "/tmp/bar.txt"
+    assert hash(ff) == hash("/tmp/bar.txt")
+
+
+def test_flyte_file_class_getitem_is_cached():
+    assert FlyteFile["csv"] is FlyteFile["csv"]
+    assert FlyteFile[".csv"] is FlyteFile["csv"]
+    assert FlyteFile["csv"] is not FlyteFile["txt"]
+    assert FlyteFile["csv"].extension() == "csv"
+
+
+def test_flyte_file_remote_download_is_set_up_lazily():
+    ff = FlyteFile("s3://my-bucket/foo.txt")
+    assert ff.remote_source == "s3://my-bucket/foo.txt"
+    assert ff._local_path is None
+
+    with patch.object(FileAccessProvider, "get_data") as mock_get_data:
+        local_path = ff.download()
+    assert local_path.endswith("foo.txt")
+    assert ff.downloaded
+    mock_get_data.assert_called_once()
+    assert mock_get_data.call_args.kwargs == {"remote_path": "s3://my-bucket/foo.txt", "local_path": local_path}
+
+
+def test_flyte_file_remote_pickled_before_access():
+    ff = FlyteFile("s3://my-bucket/foo.txt")
+    hash(ff)
+    unpickled = pickle.loads(pickle.dumps(ff))
+    assert unpickled._hash_cache is None
+    assert unpickled._local_path.endswith("foo.txt")
+
+    assert unpickled._downloader.keywords == {
+        "remote_path": "s3://my-bucket/foo.txt",
+        "local_path": unpickled._local_path,
+    }
+
+
+def test_flyte_file_unpickle_without_new_attributes(local_dummy_file):
+    ff = FlyteFile(local_dummy_file)
+
+    def _old_state(self):
+        # FlyteFiles pickled by older flytekit versions have neither of these attributes
+        return {k: v for k, v in self.__dict__.items() if k not in ("_remote_ctx", "_hash_cache")}
+
+    with patch.object(FlyteFile, "__getstate__", _old_state):
+        data = pickle.dumps(ff)
+    unpickled = pickle.loads(data)
+    assert os.fspath(unpickled) == local_dummy_file
+    assert hash(unpickled) == hash(ff)
+    assert unpickled == ff
+
+
+def test_flyte_file_eq_after_hashing():
+    a, b, c = FlyteFile("/tmp/a.txt"), FlyteFile("/tmp/a.txt"), FlyteFile("/tmp/c.txt")
+    assert a == a
+    assert len({a, b, c}) == 2
+    assert a == b
+    assert a != c
+
+
+def test_flyte_file_open_closes_file(tmp_path):
+    local_file = tmp_path / "hello.txt"
+    local_file.write_text("hello")
+    ff = FlyteFile(str(local_file))
+    with ff.open("r") as f:
+        assert f.read() == "hello"
+    assert f.closed
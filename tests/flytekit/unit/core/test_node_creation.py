@@ -11,6 +11,7 @@ from flytekit import Resources, map_task, PodTemplate
 from flytekit.configuration import Image, ImageConfig
 from flytekit.core.cache import Cache
 from flytekit.core.dynamic_workflow_task import dynamic
+from flytekit.core.node import Node
 from flytekit.core.node_creation import create_node
 from flytekit.core.task import task
 from flytekit.core.workflow import workflow
@@ -21,6 +22,45 @@ from flytekit.models import literals as _literal_models
 from flytekit.models.task import Resources as _resources_models
 from flytekit.tools.translator import get_serializable
 
+serialization_settings = flytekit.configuration.SerializationSettings(
+    project="test_proj",
+    domain="test_domain",
+    version="abc",
+    image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
+    env={},
+)
+
+preset_timeout = datetime.timedelta(seconds=100)
+
+expected_requests = [
+    _resources_models.ResourceEntry(_resources_models.ResourceName.CPU, "1"),
+    _resources_models.ResourceEntry(_resources_models.ResourceName.MEMORY, "100"),
+    _resources_models.ResourceEntry(_resources_models.ResourceName.EPHEMERAL_STORAGE, "500Mi"),
+]
+expected_limits = [
+    _resources_models.ResourceEntry(_resources_models.ResourceName.CPU, "2"),
+    _resources_models.ResourceEntry(_resources_models.ResourceName.MEMORY, "200"),
+    _resources_models.ResourceEntry(_resources_models.ResourceName.EPHEMERAL_STORAGE, "1Gi"),
+]
+
+
+@task
+def echo(a: str) -> str:
+    return f"*~*~*~{a}*~*~*~"
+
+
+mapped_echo = map_task(echo)
+
+
+@task
+def print_echo(a: str):
+    print(f"*~*~*~{a}*~*~*~")
+
+
+@task(timeout=preset_timeout)
+def echo_with_timeout(a: str) -> str:
+    return f"*~*~*~{a}*~*~*~"
+
 
 def test_normal_task(mock_image_spec_builder):
     ImageBuildEngine.register("test", mock_image_spec_builder)
@@ -46,13 +86,6 @@ def test_normal_task(mock_image_spec_builder):
     assert r == "hello world"
     assert x == ["0 world", "1 world", "2 world"]
 
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
     wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
     assert len(wf_spec.template.nodes) == 2
     assert len(wf_spec.template.outputs) == 2
@@ -80,13 +113,6 @@ def test_normal_task(mock_image_spec_builder):
         t3_node = create_node(t3)
         t3_node >> t2_node
 
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
     wf_spec = get_serializable(OrderedDict(), serialization_settings, empty_wf)
     assert wf_spec.template.nodes[0].upstream_node_ids[0] == "n1"
     assert wf_spec.template.nodes[0].id == "n0"
@@ -180,6 +206,17 @@ def test_runs_before():
     my_wf(a=5, b="hello")
 
 
+def test_runs_before_deduplicates_upstream_nodes():
+    n1 = Node(id="n1", metadata=None, bindings=[], upstream_nodes=[], flyte_entity=None)
+    n2 = Node(id="n2", metadata=None, bindings=[], upstream_nodes=[], flyte_entity=None)
+    n3 = Node(id="n3", metadata=None, bindings=[], upstream_nodes=[n1], flyte_entity=None)
+
+    n1 >> n3
+    n2 >> n3
+    n2.runs_before(n3)
+    assert n3.upstream_nodes == [n1, n2]
+
+
 def test_promise_chaining():
     @task
     def task_a(x: int):
@@ -210,136 +247,51 @@ def test_promise_chaining():
     wf1(x=3)
 
 
-def test_resource_request_override():
-    @task
-    def t1(a: str) -> str:
-        return f"*~*~*~{a}*~*~*~"
-
-    @workflow
-    def my_wf(a: typing.List[str]) -> typing.List[str]:
-        mappy = map_task(t1)
-        map_node = mappy(a=a).with_overrides(requests=Resources(cpu="1", mem="100", ephemeral_storage="500Mi"))
-        return map_node
-
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
-    wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
-    assert len(wf_spec.template.nodes) == 1
-    assert wf_spec.template.nodes[0].array_node.node.task_node.overrides is not None
-    assert wf_spec.template.nodes[0].array_node.node.task_node.overrides.resources.requests == [
-        _resources_models.ResourceEntry(_resources_models.ResourceName.CPU, "1"),
-        _resources_models.ResourceEntry(_resources_models.ResourceName.MEMORY, "100"),
-        _resources_models.ResourceEntry(_resources_models.ResourceName.EPHEMERAL_STORAGE, "500Mi"),
-    ]
-    assert wf_spec.template.nodes[0].array_node.node.task_node.overrides.resources.limits == []
-
-
-def test_resource_limits_override():
-    @task
-    def t1(a: str) -> str:
-        return f"*~*~*~{a}*~*~*~"
-
-    @workflow
-    def my_wf(a: typing.List[str]) -> typing.List[str]:
-        mappy = map_task(t1)
-        map_node = mappy(a=a).with_overrides(limits=Resources(cpu="2", mem="200", ephemeral_storage="1Gi"))
-        return map_node
-
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
-    wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
-    assert len(wf_spec.template.nodes) == 1
-    assert wf_spec.template.nodes[0].array_node.node.task_node.overrides.resources.requests == []
-    assert wf_spec.template.nodes[0].array_node.node.task_node.overrides.resources.limits == [
-        _resources_models.ResourceEntry(_resources_models.ResourceName.CPU, "2"),
-        _resources_models.ResourceEntry(_resources_models.ResourceName.MEMORY, "200"),
-        _resources_models.ResourceEntry(_resources_models.ResourceName.EPHEMERAL_STORAGE, "1Gi"),
-    ]
-
-
-def test_resources_override():
-    @task
-    def t1(a: str) -> str:
-        return f"*~*~*~{a}*~*~*~"
-
+@pytest.mark.parametrize(
+    "overrides,requests,limits",
+    [
+        pytest.param(
+            {"requests": Resources(cpu="1", mem="100", ephemeral_storage="500Mi")},
+            expected_requests,
+            [],
+            id="requests",
+        ),
+        pytest.param(
+            {"limits": Resources(cpu="2", mem="200", ephemeral_storage="1Gi")},
+            [],
+            expected_limits,
+            id="limits",
+        ),
+        pytest.param(
+            {
+                "requests": Resources(cpu="1", mem="100", ephemeral_storage="500Mi"),
+                "limits": Resources(cpu="2", mem="200", ephemeral_storage="1Gi"),
+            },
+            expected_requests,
+            expected_limits,
+            id="requests_and_limits",
+        ),
+        pytest.param(
+            {"resources": Resources(cpu=("1", "2"), mem="100", ephemeral_storage=("500Mi", "1Gi"))},
+            expected_requests,
+            [
+                _resources_models.ResourceEntry(_resources_models.ResourceName.CPU, "2"),
+                _resources_models.ResourceEntry(_resources_models.ResourceName.EPHEMERAL_STORAGE, "1Gi"),
+            ],
+            id="resources",
+        ),
+    ],
+)
+def test_map_task_resources_override(overrides, requests, limits):
     @workflow
     def my_wf(a: typing.List[str]) -> typing.List[str]:
-        mappy = map_task(t1)
-        map_node = mappy(a=a).with_overrides(
-            requests=Resources(cpu="1", mem="100", ephemeral_storage="500Mi"),
-            limits=Resources(cpu="2", mem="200", ephemeral_storage="1Gi"),
-        )
-        return map_node
-
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
-    wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
-    assert len(wf_spec.template.nodes) == 1
-    assert wf_spec.template.nodes[0].array_node.node.task_node.overrides is not None
-    assert wf_spec.template.nodes[0].array_node.node.task_node.overrides.resources.requests == [
-        _resources_models.ResourceEntry(_resources_models.ResourceName.CPU, "1"),
-        _resources_models.ResourceEntry(_resources_models.ResourceName.MEMORY, "100"),
-        _resources_models.ResourceEntry(_resources_models.ResourceName.EPHEMERAL_STORAGE, "500Mi"),
-    ]
-
-    assert wf_spec.template.nodes[0].array_node.node.task_node.overrides.resources.limits == [
-        _resources_models.ResourceEntry(_resources_models.ResourceName.CPU, "2"),
-        _resources_models.ResourceEntry(_resources_models.ResourceName.MEMORY, "200"),
-        _resources_models.ResourceEntry(_resources_models.ResourceName.EPHEMERAL_STORAGE, "1Gi"),
-    ]
-
-
-def test_map_task_resources_override_directly():
-    @task
-    def t1(a: str) -> str:
-        return f"*~*~*~{a}*~*~*~"
+        return mapped_echo(a=a).with_overrides(**overrides)
 
-    @workflow
-    def my_wf(a: typing.List[str]) -> typing.List[str]:
-        mappy = map_task(t1)
-        map_node = mappy(a=a).with_overrides(
-            resources=Resources(cpu=("1", "2"), mem="100", ephemeral_storage=("500Mi", "1Gi")),
-        )
-        return map_node
-
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
     wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
     assert len(wf_spec.template.nodes) == 1
     assert wf_spec.template.nodes[0].array_node.node.task_node.overrides is not None
-    assert wf_spec.template.nodes[0].array_node.node.task_node.overrides.resources.requests == [
-        _resources_models.ResourceEntry(_resources_models.ResourceName.CPU, "1"),
-        _resources_models.ResourceEntry(_resources_models.ResourceName.MEMORY, "100"),
-        _resources_models.ResourceEntry(_resources_models.ResourceName.EPHEMERAL_STORAGE, "500Mi"),
-    ]
-
-    assert wf_spec.template.nodes[0].array_node.node.task_node.overrides.resources.limits == [
-        _resources_models.ResourceEntry(_resources_models.ResourceName.CPU, "2"),
-        _resources_models.ResourceEntry(_resources_models.ResourceName.EPHEMERAL_STORAGE, "1Gi"),
-    ]
-
-
-preset_timeout = datetime.timedelta(seconds=100)
+    assert wf_spec.template.nodes[0].array_node.node.task_node.overrides.resources.requests == requests
+    assert wf_spec.template.nodes[0].array_node.node.task_node.overrides.resources.limits == limits
 
 
 @pytest.mark.parametrize(
@@ -358,31 +310,14 @@ def test_timeout_override(
         t2_expected_timeout_overridden,
         t2_expected_timeout_unset,
     ):
-    @task
-    def t1(a: str) -> str:
-        return f"*~*~*~{a}*~*~*~"
-
-    @task(
-        timeout=preset_timeout
-    )
-    def t2(a: str) -> str:
-        return f"*~*~*~{a}*~*~*~"
-
     @workflow
     def my_wf(a: str) -> str:
-        s = t1(a=a).with_overrides(timeout=timeout)
-        s1 = t1(a=s).with_overrides()
-        s2 = t2(a=s1).with_overrides(timeout=timeout)
-        s3 = t2(a=s2).with_overrides()
+        s = echo(a=a).with_overrides(timeout=timeout)
+        s1 = echo(a=s).with_overrides()
+        s2 = echo_with_timeout(a=s1).with_overrides(timeout=timeout)
+        s3 = echo_with_timeout(a=s2).with_overrides()
         return s3
 
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
     wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
     assert len(wf_spec.template.nodes) == 4
     assert wf_spec.template.nodes[0].metadata.timeout == t1_expected_timeout_overridden
@@ -392,15 +327,11 @@ def test_timeout_override(
 
 
 def test_timeout_override_invalid_value():
-    @task
-    def t1(a: str) -> str:
-        return f"*~*~*~{a}*~*~*~"
-
     with pytest.raises(ValueError, match="datetime.timedelta or int seconds"):
 
         @workflow
         def my_wf(a: str) -> str:
-            return t1(a=a).with_overrides(timeout="foo")
+            return echo(a=a).with_overrides(timeout="foo")
 
         my_wf()
 
@@ -410,21 +341,10 @@ def test_timeout_override_invalid_value():
     [(None, _literal_models.RetryStrategy(0)), (3, _literal_models.RetryStrategy(3))],
 )
 def test_retries_override(retries, expected):
-    @task
-    def t1(a: str) -> str:
-        return f"*~*~*~{a}*~*~*~"
-
     @workflow
     def my_wf(a: str) -> str:
-        return t1(a=a).with_overrides(retries=retries)
-
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
+        return echo(a=a).with_overrides(retries=retries)
+
     wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
     assert len(wf_spec.template.nodes) == 1
     assert wf_spec.template.nodes[0].metadata.retries == expected
@@ -432,42 +352,20 @@ def test_retries_override(retries, expected):
 
 @pytest.mark.parametrize("interruptible", [None, True, False])
 def test_interruptible_override(interruptible):
-    @task
-    def t1(a: str) -> str:
-        return f"*~*~*~{a}*~*~*~"
-
     @workflow
     def my_wf(a: str) -> str:
-        return t1(a=a).with_overrides(interruptible=interruptible)
-
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
+        return echo(a=a).with_overrides(interruptible=interruptible)
+
     wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
     assert len(wf_spec.template.nodes) == 1
     assert wf_spec.template.nodes[0].metadata.interruptible == interruptible
 
 
 def test_void_promise_override():
-    @task
-    def t1(a: str):
-        print(f"*~*~*~{a}*~*~*~")
-
     @workflow
     def my_wf(a: str):
-        t1(a=a).with_overrides(requests=Resources(cpu="1", mem="100"))
-
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
+        print_echo(a=a).with_overrides(requests=Resources(cpu="1", mem="100"))
+
     wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
     assert len(wf_spec.template.nodes) == 1
     assert wf_spec.template.nodes[0].task_node.overrides.resources.requests == [
@@ -477,21 +375,10 @@ def test_void_promise_override():
 
 
 def test_void_promise_override_resource_directly():
-    @task
-    def t1(a: str):
-        print(f"*~*~*~{a}*~*~*~")
-
     @workflow
     def my_wf(a: str):
-        t1(a=a).with_overrides(resources=Resources(cpu=("1", "2"), mem="100"))
-
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
+        print_echo(a=a).with_overrides(resources=Resources(cpu=("1", "2"), mem="100"))
+
     wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
     assert len(wf_spec.template.nodes) == 1
     assert wf_spec.template.nodes[0].task_node.overrides.resources.requests == [
@@ -504,21 +391,10 @@ def test_void_promise_override_resource_directly():
 
 
 def test_name_override():
-    @task
-    def t1(a: str) -> str:
-        return f"*~*~*~{a}*~*~*~"
-
     @workflow
     def my_wf(a: str) -> str:
-        return t1(a=a).with_overrides(name="foo", node_name="t_1")
-
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
+        return echo(a=a).with_overrides(name="foo", node_name="t_1")
+
     wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
     assert len(wf_spec.template.nodes) == 1
     assert wf_spec.template.nodes[0].metadata.name == "foo"
@@ -561,6 +437,28 @@ def test_override_image():
 
     assert wf.nodes[0]._container_image == "hello/world"
 
+
+pod_template = PodTemplate(
+    primary_container_name="primary1",
+    labels={"lKeyA": "lValA", "lKeyB": "lValB"},
+    annotations={"aKeyA": "aValA", "aKeyB": "aValB"},
+    pod_spec=V1PodSpec(
+        containers=[
+            V1Container(
+                name="primary1",
+                image="random:image",
+                env=[V1EnvVar(name="eKeyC", value="eValC"), V1EnvVar(name="eKeyD", value="eValD")],
+            ),
+            V1Container(
+                name="primary2",
+                image="random:image2",
+                env=[V1EnvVar(name="eKeyC", value="eValC"), V1EnvVar(name="eKeyD", value="eValD")],
+            ),
+        ],
+    ),
+)
+
+
 def test_pod_template_override():
     @task
     def bar():
@@ -568,25 +466,7 @@ def test_pod_template_override():
 
     @workflow
     def wf() -> str:
-        bar().with_overrides(pod_template=PodTemplate(
-        primary_container_name="primary1",
-        labels={"lKeyA": "lValA", "lKeyB": "lValB"},
-        annotations={"aKeyA": "aValA", "aKeyB": "aValB"},
-        pod_spec=V1PodSpec(
-            containers=[
-                V1Container(
-                    name="primary1",
-                    image="random:image",
-                    env=[V1EnvVar(name="eKeyC", value="eValC"), V1EnvVar(name="eKeyD", value="eValD")],
-                ),
-                V1Container(
-                    name="primary2",
-                    image="random:image2",
-                    env=[V1EnvVar(name="eKeyC", value="eValC"), V1EnvVar(name="eKeyD", value="eValD")],
-                ),
-            ],
-        )
-        ))
+        bar().with_overrides(pod_template=pod_template)
         return "hi"
 
     assert wf.nodes[0]._pod_template.primary_container_name == "primary1"
@@ -602,15 +482,8 @@ def test_override_accelerator():
 
     @workflow
     def my_wf() -> str:
-        return bar().with_overrides(accelerator=A100.partition_1g_5gb)
-
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
+        return bar().with_overrides(accelerator=A100.partition_1g_5gb).with_overrides(retries=2)
+
     wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
     assert len(wf_spec.template.nodes) == 1
     assert wf_spec.template.nodes[0].task_node.overrides is not None
@@ -630,13 +503,6 @@ def test_override_shared_memory():
     def my_wf() -> str:
         return bar().with_overrides(shared_memory="128Mi")
 
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
     wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
     assert len(wf_spec.template.nodes) == 1
     assert wf_spec.template.nodes[0].task_node.overrides is not None
@@ -645,25 +511,14 @@ def test_override_shared_memory():
 
 
 def test_cache_override_values():
-    @task
-    def t1(a: str) -> str:
-        return f"*~*~*~{a}*~*~*~"
-
     @workflow
     def my_wf(a: str) -> str:
-        return t1(a=a).with_overrides(cache=True, cache_version="foo", cache_serialize=True)
+        return echo(a=a).with_overrides(cache=True, cache_version="foo", cache_serialize=True)
 
     @workflow
     def my_wf_cache_policy(a: str) -> str:
-        return t1(a=a).with_overrides(cache=Cache(version="foo", serialize=True))
-
-    serialization_settings = flytekit.configuration.SerializationSettings(
-        project="test_proj",
-        domain="test_domain",
-        version="abc",
-        image_config=ImageConfig(Image(name="name", fqn="image", tag="name")),
-        env={},
-    )
+        return echo(a=a).with_overrides(cache=Cache(version="foo", serialize=True))
+
     wf_spec = get_serializable(OrderedDict(), serialization_settings, my_wf)
     wf_spec_cache_policy = get_serializable(OrderedDict(), serialization_settings, my_wf_cache_policy)
 
@@ -672,3 +527,20 @@ def test_cache_override_values():
     assert wf_spec.template.nodes[0].metadata.cache_version == "foo"
 
     assert wf_spec.template.nodes[0] == wf_spec_cache_policy.template.nodes[0]
+
+
+def test_override_with_promise_fails():
+    @task
+    def image() -> str:
+        return "my-image:latest"
+
+    @task
+    def t1() -> str:
+        return "hello"
+
+    @workflow
+    def my_wf() -> str:
+        return t1().with_overrides(container_image=image())
+
+    with pytest.raises(AssertionError, match="Cannot use a promise in the container_image"):
+        my_wf.compile()
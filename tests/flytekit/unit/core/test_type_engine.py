@@ -2859,8 +2859,11 @@ def test_is_annotated(t, expected):
     "t,expected",
     [
         (typing.List, typing.List),
+        (int, int),
+        (list[int], list[int]),
         (Annotated[int, "tag"], int),
         (Annotated[typing.List[str], "a", "b"], typing.List[str]),
+        (Annotated[list[int], "tag"], list[int]),
     ],
 )
 def test_get_underlying_type(t, expected):
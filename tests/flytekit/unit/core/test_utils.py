@@ -23,6 +23,9 @@ from tests.flytekit.unit.test_translator import default_img
         ("test$", "test"),
         ("te$t$", "tet"),
         ("t" * 64, f"da4b348ebe-{'t'*52}"),
+        ("n0-my-task-1", "n0-my-task-1"),
+        ("t" * 62, "t" * 62),
+        ("t" * 63, f"6319487038-{'t'*52}"),
     ],
 )
 def test_dnsify(input, expected):
@@ -22,3 +22,15 @@ def test_lazy_module():
     assert is_imported("fake_module")
 
     assert is_imported("dataclasses")
+
+
+def test_flytekit_lazy_top_level_imports():
+    import flytekit
+    from flytekit.remote import FlyteRemote
+    from flytekit.types.structured.structured_dataset import StructuredDataset
+
+    assert "FlyteRemote" in dir(flytekit)
+    assert flytekit.FlyteRemote is FlyteRemote
+    assert flytekit.StructuredDataset is StructuredDataset
+    with pytest.raises(AttributeError):
+        flytekit.not_a_real_attribute
@@ -0,0 +1,58 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import flytekit
+
+
+@patch("flytekit._discovered_flytekit_plugins")
+def test_load_implicit_plugins_once(discovered, monkeypatch):
+    plugin = MagicMock()
+    discovered.return_value = (plugin,)
+
+    monkeypatch.setattr(flytekit, "_PLUGINS_LOADED", False)
+    flytekit.load_implicit_plugins()
+    flytekit.load_implicit_plugins()
+
+    plugin.load.assert_called_once()
+
+
+@patch("flytekit._discovered_flytekit_plugins")
+def test_load_implicit_plugins_broken_plugin_raises(discovered, monkeypatch):
+    broken = MagicMock()
+    broken.load.side_effect = ImportError("boom")
+    discovered.return_value = (broken,)
+
+    monkeypatch.setattr(flytekit, "_PLUGINS_LOADED", False)
+    with pytest.raises(ImportError, match="boom"):
+        flytekit.load_implicit_plugins()
+
+
+@patch("flytekit._discovered_flytekit_plugins")
+def test_load_implicit_plugins_disabled(discovered, monkeypatch):
+    monkeypatch.setattr(flytekit, "_PLUGINS_LOADED", False)
+    monkeypatch.setenv(flytekit.DISABLE_PLUGIN_AUTOLOAD_ENV_VAR, "1")
+    flytekit.load_implicit_plugins()
+
+    discovered.assert_not_called()
+    assert flytekit._PLUGINS_LOADED is False
+
+
+@pytest.mark.parametrize(
+    "env, argv, expected",
+    [
+        ({}, ["pyflyte", "run", "wf.py", "wf"], False),
+        ({}, ["/usr/bin/pyflyte", "--help"], True),
+        ({}, ["pyflyte", "run", "--help"], False),
+        ({}, ["pyflyte", "--version"], False),
+        ({}, ["pyflyte", "-h"], False),
+        ({flytekit.FAST_IMPORT_ENV_VAR: "1"}, ["python", "script.py"], True),
+    ],
+)
+def test_is_fast_import(env, argv, expected, monkeypatch):
+    monkeypatch.delenv(flytekit.FAST_IMPORT_ENV_VAR, raising=False)
+    for k, v in env.items():
+        monkeypatch.setenv(k, v)
+    monkeypatch.setattr(sys, "argv", argv)
+    assert flytekit._is_fast_import() is expected
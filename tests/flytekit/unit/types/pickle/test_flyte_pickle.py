@@ -1,8 +1,12 @@
+import os
 import sys
+import tempfile
 from collections import OrderedDict
 from collections.abc import Sequence
 from typing import Any, Dict, List, Union, Tuple
 
+import cloudpickle
+import mock
 import numpy as np
 import pytest
 from typing_extensions import Annotated
@@ -10,6 +14,7 @@ from typing_extensions import Annotated
 import flytekit.configuration
 from flytekit.configuration import Image, ImageConfig
 from flytekit.core import context_manager
+from flytekit.core.data_persistence import FileAccessProvider
 from flytekit.core.task import task
 from flytekit.core.workflow import workflow
 from flytekit.models.core.types import BlobType
@@ -171,3 +176,26 @@ def test_default_args_task():
     assert wf_no_input() == default_val
     assert wf_with_input() == input_val
     assert wf_with_sub_wf() == (default_val, input_val)
+
+
+@pytest.mark.asyncio
+async def test_to_pickle_uploads_every_value():
+    ctx = mock.MagicMock()
+    ctx.file_access = FileAccessProvider(tempfile.mkdtemp(), "s3://my-bucket/prefix/")
+    ctx.file_access.async_put_raw_data = mock.AsyncMock(side_effect=lambda path: f"s3://my-bucket/{path}")
+
+    # Identical values are uploaded again, an earlier upload may belong to another execution and be gone by now
+    await FlytePickle.to_pickle(ctx, {"a": [1, 2]})
+    await FlytePickle.to_pickle(ctx, {"a": [1, 2]})
+    assert ctx.file_access.async_put_raw_data.call_count == 2
+
+    local_path = ctx.file_access.async_put_raw_data.call_args.args[0]
+    with open(local_path, "rb") as f:
+        assert cloudpickle.load(f) == {"a": [1, 2]}
+
+
+def test_class_getitem_is_cached():
+    assert FlytePickle[int] is FlytePickle[int]
+    assert FlytePickle[int].python_type() is int
+    assert FlytePickle[str] is not FlytePickle[int]
+    assert FlytePickle[None] is FlytePickle